@@ -4,6 +4,8 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
 
+from excel_export import write_sheets
+
 # -----------------------------
 # Load dataset
 # -----------------------------
@@ -86,10 +88,9 @@ print(importance)
 # -----------------------------
 model_df['Attrition_Risk_Score'] = model.predict_proba(scaler.transform(X))[:, 1]
 
-with pd.ExcelWriter("Attrition_Risk_Output.xlsx") as writer:
-    model_df[['Full Name', 'Year', 'Resignee_Binary', 'Attrition_Risk_Score']].to_excel(
-        writer, sheet_name="Attrition Risk Scores", index=False
-    )
-    importance.to_excel(writer, sheet_name="Feature Importance", index=False)
+write_sheets("Attrition_Risk_Output.xlsx", {
+    "Attrition Risk Scores": model_df[['Full Name', 'Year', 'Resignee_Binary', 'Attrition_Risk_Score']],
+    "Feature Importance": importance,
+})
 
 print("Results saved to Attrition_Risk_Output.xlsx")
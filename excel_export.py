@@ -0,0 +1,38 @@
+import time
+
+import pandas as pd
+from openpyxl import Workbook
+
+
+# -----------------------------
+# Streaming Excel export
+# -----------------------------
+def _clean(value):
+    # openpyxl cannot store NaN / NaT, write them as empty cells like to_excel does
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return None
+    return value
+
+
+def write_sheets(path, sheets):
+    """Write {sheet name: DataFrame} to `path` in openpyxl write-only mode.
+
+    Rows are streamed straight to disk instead of building the whole workbook
+    in memory. Sheet names, column headers and order match
+    `df.to_excel(writer, sheet_name=name, index=False)`.
+    """
+    wb = Workbook(write_only=True)
+    total_start = time.perf_counter()
+
+    for sheet_name, frame in sheets.items():
+        start = time.perf_counter()
+        ws = wb.create_sheet(title=sheet_name)
+        ws.append([str(col) for col in frame.columns])
+        for row in frame.itertuples(index=False, name=None):
+            ws.append([_clean(value) for value in row])
+        print(f"  {sheet_name}: {len(frame)} rows in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    wb.save(path)
+    print(f"  (save) {time.perf_counter() - start:.2f}s")
+    print(f"Wrote {len(sheets)} sheets to {path} in {time.perf_counter() - total_start:.2f}s")
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from excel_export import write_sheets
+
 # -----------------------------
 # Load dataset
 # -----------------------------
@@ -193,24 +195,25 @@ tenure_distribution = tenure_distribution.merge(headcount_per_year, on='Year')
 # -----------------------------
 # Save all outputs to Excel
 # -----------------------------
-with pd.ExcelWriter('HR_Analysis_Output.xlsx') as writer:
-    age_distribution.to_excel(writer, sheet_name='Age Distribution', index=False)
-    generation_distribution.to_excel(writer, sheet_name='Generation Distribution', index=False)
-    gender_distribution.to_excel(writer, sheet_name='Gender Diversity', index=False)
-    tenure_distribution.to_excel(writer, sheet_name='Tenure Analysis', index=False)
-    resignation_trends.to_excel(writer, sheet_name='Resignation Trends', index=False)
-    retention_cohort.to_excel(writer, sheet_name='Retention by Cohort (Names)', index=False)
-    retention_summary.to_excel(writer, sheet_name='Retention by Cohort (Summary)', index=False)
-    promotion_transfer_tracking.to_excel(writer, sheet_name='Promotion & Transfer', index=False)
-    duplicates.to_excel(writer, sheet_name='Duplicate Names by Cohort', index=False)
-    headcount_per_year.to_excel(writer, sheet_name='Headcount Per Year', index=False)
-    likert_per_year_percentage.to_excel(writer, sheet_name='Satisfaction Prct', index=False)
-    likert_per_year_count.to_excel(writer, sheet_name='Satisfaction Count', index=False)
-    engagement_index_per_year.to_excel(writer, sheet_name='Engagement Index', index=False)
-    driver_resignation_df.to_excel(writer, sheet_name='Driver-Resignation', index=False)
-    driver_promotion_df.to_excel(writer, sheet_name='Driver-Promotion', index=False)
-    promotion_predictors_df.to_excel(writer, sheet_name='Promotion Predictors', index=False)
-    engagement_retention.to_excel(writer, sheet_name='Engagement vs Retention', index=False)
-    satisfaction_retention.to_excel(writer, sheet_name='Satisfaction vs Retention', index=False)
+write_sheets('HR_Analysis_Output.xlsx', {
+    'Age Distribution': age_distribution,
+    'Generation Distribution': generation_distribution,
+    'Gender Diversity': gender_distribution,
+    'Tenure Analysis': tenure_distribution,
+    'Resignation Trends': resignation_trends,
+    'Retention by Cohort (Names)': retention_cohort,
+    'Retention by Cohort (Summary)': retention_summary,
+    'Promotion & Transfer': promotion_transfer_tracking,
+    'Duplicate Names by Cohort': duplicates,
+    'Headcount Per Year': headcount_per_year,
+    'Satisfaction Prct': likert_per_year_percentage,
+    'Satisfaction Count': likert_per_year_count,
+    'Engagement Index': engagement_index_per_year,
+    'Driver-Resignation': driver_resignation_df,
+    'Driver-Promotion': driver_promotion_df,
+    'Promotion Predictors': promotion_predictors_df,
+    'Engagement vs Retention': engagement_retention,
+    'Satisfaction vs Retention': satisfaction_retention,
+})
 
 print("Results saved to HR_Analysis_Output.xlsx")